@@ -0,0 +1,126 @@
+import os
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from event_stream import EventStream, open_game_stream, find_archives
+from moment_arrays import MomentArrays, ANOMALIES
+
+# A 7z signature header with no packed streams after it
+EMPTY_ARCHIVE_SIZE = 32
+
+
+def inspect_event(event, issues):
+    """Summarize one event: its moment count, valid moments and the clock range it covers"""
+    moments = event['moments']
+    if not moments:
+        issues['empty_events'] += 1
+        return {'event_id': event.get('eventId'), 'moments': 0}
+    # The same validation the loaders use, so both tools agree on what counts as an anomaly
+    report = MomentArrays.from_event(event).repair().report()
+    for name in ANOMALIES:
+        issues[name] += report[name]
+    return {
+        'event_id': event.get('eventId'),
+        'moments': len(moments),
+        'valid_moments': report['valid'],
+        'quarter': moments[0][0],
+        'start_clock': moments[0][2],
+        'end_clock': moments[-1][2],
+    }
+
+
+def inspect_archive(path):
+    """
+    Stream one game archive and report its contents and schema problems.
+
+    Args:
+        path (str): Path to the game .7z or .json file.
+
+    Returns:
+        dict: Summary of the game, or an 'error' entry if the archive could not be read.
+    """
+    summary = {'path': path}
+    if path.endswith('.7z') and os.path.getsize(path) <= EMPTY_ARCHIVE_SIZE:
+        summary['error'] = 'empty archive'
+        return summary
+
+    issues = dict.fromkeys(['empty_events'] + ANOMALIES, 0)
+    events = []
+    try:
+        with open_game_stream(path) as f:
+            stream = EventStream(f)
+            for event in stream:
+                if not events:
+                    summary['teams'] = {}
+                    for side in ('home', 'visitor'):
+                        team = event[side]
+                        summary['teams'][side] = {
+                            'name': team.get('abbreviation'),
+                            'roster': [" ".join([player['firstname'], player['lastname']])
+                                       for player in team['players']],
+                        }
+                events.append(inspect_event(event, issues))
+    except Exception as e:
+        summary['error'] = f"{type(e).__name__}: {e}"
+        return summary
+
+    summary['game_id'] = stream.header.get('gameid')
+    summary['game_date'] = stream.header.get('gamedate')
+    summary['event_count'] = len(events)
+    summary['events'] = events
+    summary['issues'] = issues
+    return summary
+
+
+def print_summary(summary, show_events=False):
+    print(f"\n=== {summary['path']} ===")
+    if 'error' in summary:
+        print(f"Skipped: {summary['error']}")
+        return
+
+    print(f"Game {summary['game_id']} on {summary['game_date']}")
+    for side, team in summary.get('teams', {}).items():
+        print(f"{side.capitalize()}: {team['name']} ({len(team['roster'])} players) - {', '.join(team['roster'])}")
+
+    moment_counts = [event['moments'] for event in summary['events']]
+    print(f"Number of events: {summary['event_count']}")
+    if moment_counts:
+        print(f"Moments per event: min {min(moment_counts)}, max {max(moment_counts)}, total {sum(moment_counts)}")
+
+    if show_events:
+        for index, event in enumerate(summary['events']):
+            if event['moments']:
+                print(f"  {index:4d}  event {event['event_id']}  Q{event['quarter']}  "
+                      f"{event['start_clock']:6.1f} -> {event['end_clock']:6.1f}  {event['moments']} moments, "
+                      f"{event['valid_moments']} valid")
+            else:
+                print(f"  {index:4d}  event {event['event_id']}  no moments")
+
+    problems = {name: count for name, count in summary['issues'].items() if count}
+    print("Schema check: " + (", ".join(f"{name}={count}" for name, count in problems.items()) or "ok"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Inspect NBA game archives without extracting them.')
+    parser.add_argument('--path', type=str, nargs='+', required=True,
+                        help='Game .7z/.json files or directories of them')
+    parser.add_argument('--events', action='store_true', help='List moments and clock range of every event')
+    parser.add_argument('--workers', type=int, default=None, help='Number of archives inspected in parallel')
+    parser.add_argument('--json', type=str, default=None, help='Also write the summaries to this .json file')
+
+    args = parser.parse_args()
+
+    try:
+        archives = find_archives(args.path)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        summaries = list(executor.map(inspect_archive, archives))
+
+    for summary in summaries:
+        print_summary(summary, show_events=args.events)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summaries, f, indent=4)
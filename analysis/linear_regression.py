@@ -7,6 +7,7 @@ import seaborn as sns
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score
 import argparse
+from spacing_store import SpacingStore
 
 class LinearRegressionModel:
     """
@@ -43,6 +44,20 @@ class LinearRegressionModel:
         
         print(f"Loaded data from {json_file}")
 
+    def load_from_store(self, store_path):
+        """
+        Reads per-game differentials from a season spacing table instead of decoding games.
+        """
+        differentials = SpacingStore(store_path).game_differentials()
+        if differentials.empty:
+            # SportVU logs carry no scores, so score_diff stays empty until scores are added to the table
+            raise ValueError(f"No games in {store_path} have both spacing and a score differential; "
+                             "fill the 'score_diff' column from a box-score source before running the regression")
+        self.home_defensive_spacing_diff = list(differentials['home_defensive_spacing_diff'])
+        self.home_score_diff = list(differentials['home_score_diff'])
+
+        print(f"Loaded {len(differentials)} games from {store_path}")
+
     def process_data(self):
         """
         Processes the loaded game data to extract the defensive spacing
@@ -109,13 +124,23 @@ class LinearRegressionModel:
 
 def main():
     parser = argparse.ArgumentParser(description="Perform linear regression on NBA game data.")
-    parser.add_argument('--path', required=True, help="Path to the .7z file containing the game data.")
+    parser.add_argument('--path', help="Path to the .7z file containing the game data.")
+    parser.add_argument('--store', help="Path to a season spacing table built by spacing_store.py.")
     args = parser.parse_args()
 
+    if not args.path and not args.store:
+        parser.error("one of --path or --store is required")
+
     regressor = LinearRegressionModel(file_path=args.path)
-    
-    regressor.load_data()
-    regressor.process_data()
+
+    if args.store:
+        try:
+            regressor.load_from_store(args.store)
+        except ValueError as e:
+            parser.exit(1, f"{e}\n")
+    else:
+        regressor.load_data()
+        regressor.process_data()
 
     regressor.perform_regression()
 
@@ -0,0 +1,226 @@
+import os
+import argparse
+import numpy as np
+from event_stream import iter_events, find_archives
+from moment_arrays import MomentArrays, PLAYERS_PER_TEAM, COURT_LENGTH, COURT_WIDTH, HALF_COURT_X, LEFT_BASKET
+
+# Number of time steps every event is resampled to; changing it invalidates stored indexes
+SAMPLES = 16
+MIN_MOMENTS = 25
+
+
+def embed_event(event, samples=SAMPLES):
+    """
+    Turn one event into a fixed-length trajectory vector.
+
+    The court is rotated so the offense always attacks the left basket, players are
+    ordered offense first then defense, each team sorted by average distance to the
+    basket, and the ball and ten player tracks are resampled to the same number of steps.
+
+    Args:
+        event (dict): Event from the game .json file.
+        samples (int): Number of time steps to resample to.
+
+    Returns:
+        np.ndarray: Vector of length samples * 11 * 2, or None if the event is too short.
+    """
+    arrays = MomentArrays.from_event(event).repair()
+    arrays = arrays.take(arrays.valid)
+    if len(arrays) < MIN_MOMENTS:
+        return None
+
+    # Stop at the first substitution so every track follows the same player
+    same_lineup = (arrays.player_ids == arrays.player_ids[0]).all(axis=1)
+    if not same_lineup.all():
+        arrays = arrays.take(slice(None, np.argmin(same_lineup)))
+    if len(arrays) < MIN_MOMENTS:
+        return None
+
+    ball = arrays.ball[:, :2]
+    positions = np.concatenate([ball[:, None, :], arrays.players], axis=1)
+    if ball[:, 0].mean() > HALF_COURT_X:
+        positions = np.array([COURT_LENGTH, COURT_WIDTH]) - positions
+
+    team_ids = np.repeat([arrays.home_id, arrays.visitor_id], PLAYERS_PER_TEAM)
+    distances = np.hypot(positions[:, 1:, 0] - LEFT_BASKET[0], positions[:, 1:, 1] - LEFT_BASKET[1]).mean(axis=0)
+    teams = np.array([arrays.home_id, arrays.visitor_id])
+    team_distance = [distances[team_ids == team].mean() for team in teams]
+    offense, defense = (teams[0], teams[1]) if team_distance[0] > team_distance[1] else (teams[1], teams[0])
+    order = [np.flatnonzero(team_ids == team)[np.argsort(distances[team_ids == team])]
+             for team in (offense, defense)]
+    positions = positions[:, np.concatenate([[0], 1 + np.concatenate(order)])]
+
+    steps = np.linspace(0, len(positions) - 1, samples)
+    low = np.floor(steps).astype(int)
+    high = np.minimum(low + 1, len(positions) - 1)
+    weight = (steps - low)[:, None, None]
+    resampled = positions[low] * (1 - weight) + positions[high] * weight
+    return resampled.reshape(-1).astype(np.float32)
+
+
+class PlaySimilarityIndex:
+    """
+    A nearest-neighbor index of event trajectories persisted as a .npz file.
+    """
+
+    def __init__(self, path='play_index.npz'):
+        self.path = path
+        self._pending = []
+        self._norms = None
+        if os.path.exists(path):
+            stored = np.load(path)
+            if int(stored['samples']) != SAMPLES:
+                raise ValueError(f"{path} was built with {int(stored['samples'])} samples per event, "
+                                 f"expected {SAMPLES}; rebuild the index")
+            self.vectors = stored['vectors']
+            self.sources = stored['sources'].tolist()
+            self.event_numbers = stored['event_numbers'].tolist()
+            # Games that yielded no vectors are only recorded here, so they are not decoded again;
+            # indexes saved before event counts were kept have an unknown count
+            if 'game_events' in stored.files:
+                self._games = {game: None if count < 0 else count
+                               for game, count in zip(stored['games'].tolist(), stored['game_events'].tolist())}
+            else:
+                self._games = dict.fromkeys(stored['games'].tolist() if 'games' in stored.files else self.sources)
+        else:
+            self.vectors = np.empty((0, SAMPLES * 11 * 2), dtype=np.float32)
+            self.sources = []
+            self.event_numbers = []
+            self._games = {}
+        self._rows = dict(zip(zip(self.sources, self.event_numbers), range(len(self.sources))))
+
+    def __len__(self):
+        return len(self.sources)
+
+    def add_game(self, path):
+        """
+        Index every event of a game, skipping games that are already indexed.
+
+        Args:
+            path (str): Path to the game .7z or .json file.
+
+        Returns:
+            int: Number of events added.
+        """
+        source = os.path.basename(path)
+        if source in self._games:
+            return 0
+
+        vectors = []
+        event_numbers = []
+        event_count = 0
+        for event_number, event in enumerate(iter_events(path)):
+            event_count += 1
+            vector = embed_event(event)
+            if vector is not None:
+                vectors.append(vector)
+                event_numbers.append(event_number)
+
+        # Only whole games are inserted, so a failed read never leaves a game half indexed
+        self._rows.update({(source, event_number): len(self.sources) + offset
+                           for offset, event_number in enumerate(event_numbers)})
+        self._pending += vectors
+        self.sources += [source] * len(vectors)
+        self.event_numbers += event_numbers
+        self._games[source] = event_count
+        self._norms = None
+        return len(vectors)
+
+    def _consolidate(self):
+        # Vectors are batched so inserting a whole season does not copy the matrix once per game
+        if self._pending:
+            self.vectors = np.concatenate([self.vectors, np.array(self._pending)])
+            self._pending = []
+
+    def save(self):
+        self._consolidate()
+        np.savez(self.path, vectors=self.vectors, sources=np.array(self.sources),
+                 event_numbers=np.array(self.event_numbers, dtype=int),
+                 games=np.array(list(self._games), dtype=str),
+                 game_events=np.array([-1 if count is None else count for count in self._games.values()], dtype=int),
+                 samples=SAMPLES)
+
+    def query(self, vector, k=10, exclude=None):
+        """
+        Find the plays closest to a trajectory vector.
+
+        Args:
+            vector (np.ndarray): Vector from embed_event.
+            k (int): Number of plays to return.
+            exclude (tuple): (source, event_number) to leave out, usually the query play itself.
+
+        Returns:
+            list: (source, event_number, distance) tuples, closest first.
+        """
+        self._consolidate()
+        if not len(self):
+            return []
+        if self._norms is None:
+            self._norms = np.einsum('ij,ij->i', self.vectors, self.vectors)
+
+        # Brute-force search from cached squared norms is one matrix-vector product per query
+        squared = np.maximum(self._norms - 2 * (self.vectors @ vector) + vector @ vector, 0)
+        count = min(k + 1, len(self))
+        indices = np.argpartition(squared, count - 1)[:count]
+        indices = indices[np.argsort(squared[indices])]
+        results = []
+        for distance, index in zip(np.sqrt(squared[indices]), indices):
+            key = (self.sources[index], int(self.event_numbers[index]))
+            if key == exclude:
+                continue
+            results.append(key + (float(distance),))
+        return results[:k]
+
+    def query_event(self, path, event_number, k=10):
+        """Find the plays closest to one event of a game, decoding the game only if it is not indexed"""
+        source = os.path.basename(path)
+        event_count = self._games.get(source)
+        if (source, event_number) in self._rows:
+            self._consolidate()
+            vector = self.vectors[self._rows[(source, event_number)]]
+        elif event_count is not None:
+            if not 0 <= event_number < event_count:
+                raise IndexError(f"Event {event_number} not found in {path}")
+            # Indexed games keep a vector for every event long enough to embed
+            vector = None
+        else:
+            for index, event in enumerate(iter_events(path)):
+                if index == event_number:
+                    vector = embed_event(event)
+                    break
+            else:
+                raise IndexError(f"Event {event_number} not found in {path}")
+
+        if vector is None:
+            raise ValueError(f"Event {event_number} of {path} has too few playable moments to compare")
+        return self.query(vector, k, exclude=(source, event_number))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Index plays and find the ones most similar to a given event.')
+    parser.add_argument('--index', type=str, default='play_index.npz', help='Path of the play index')
+    parser.add_argument('--add', type=str, nargs='*', default=[],
+                        help='Game .7z/.json files or directories to add to the index')
+    parser.add_argument('--path', type=str, default=None, help='Game containing the query event')
+    parser.add_argument('--event', type=int, default=0, help='Index of the query event')
+    parser.add_argument('--k', type=int, default=10, help='Number of similar plays to list')
+
+    args = parser.parse_args()
+
+    try:
+        archives = find_archives(args.add)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+
+    index = PlaySimilarityIndex(args.index)
+    if archives:
+        for game_path in archives:
+            try:
+                print(f"Indexed {index.add_game(game_path)} events from {game_path}")
+            except Exception as e:
+                print(f"Error indexing game {game_path}: {e}")
+        index.save()
+
+    if args.path:
+        for rank, (source, event_number, distance) in enumerate(index.query_event(args.path, args.event, args.k), 1):
+            print(f"{rank:3d}. {source} event {event_number} (distance {distance:.1f})")
@@ -1,39 +1,18 @@
 import json
-import os
-import py7zr
-import tempfile
 import argparse
 from linear_regression import LinearRegressionModel
+from event_stream import iter_events
 
-def extract_7z_and_get_json(archive_path):
-    """Extract the .7z file and return the path to the extracted .json file"""
-    temp_dir = tempfile.mkdtemp()
+def print_json_sample(path, num_events=1):
+    """Print a sample of the JSON data, streaming it from the .json or .7z file"""
+    event_count = 0
+    for i, event in enumerate(iter_events(path)):
+        if i < num_events:
+            print(f"\n--- Event {i + 1} ---")
+            print(json.dumps(event, indent=4))
+        event_count += 1
 
-    with py7zr.SevenZipFile(archive_path, mode='r') as archive:
-        archive.extractall(path=temp_dir)
-
-    json_file = None
-    for root, dirs, files in os.walk(temp_dir):
-        for file in files:
-            if file.endswith(".json"):
-                json_file = os.path.join(root, file)
-                break
-
-    if not json_file:
-        raise FileNotFoundError("No JSON file found inside the .7z archive")
-
-    return json_file
-
-def print_json_sample(json_file_path, num_events=1):
-    """Print a sample of the JSON data from the file"""
-    with open(json_file_path) as f:
-        data = json.load(f)
-    
-    print(f"Number of events: {len(data['events'])}")
-    
-    for i, event in enumerate(data['events'][:num_events]):
-        print(f"\n--- Event {i + 1} ---")
-        print(json.dumps(event, indent=4))
+    print(f"Number of events: {event_count}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Extract and print a sample of NBA game data from a .7z file.')
@@ -42,7 +21,5 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    json_file_path = extract_7z_and_get_json(args.path)
-
-    print_json_sample(json_file_path, args.num_events)
+    print_json_sample(args.path, args.num_events)
 
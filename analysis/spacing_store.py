@@ -0,0 +1,181 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+from event_stream import EventStream, open_game_stream, find_archives
+from moment_arrays import (MomentArrays, PLAYERS_PER_TEAM, HALF_COURT_X, LEFT_BASKET, RIGHT_BASKET,
+                           team_hull_areas)
+from Team import Team
+
+# Bump whenever the way hull statistics are computed changes; stale rows are recomputed on update
+METRIC_VERSION = 2
+
+
+def get_game_spacing_rows(path, source):
+    """
+    Compute per-team offense and defense hull statistics for one game.
+
+    Only valid half-court moments are used: the ball and all ten players on the same side.
+    The defending team is the one whose players are closer on average to that basket.
+    Moments repeated across consecutive events are counted once.
+
+    Args:
+        path (str): Path to the game .7z or .json file.
+        source (str): Name of the archive the game came from.
+
+    Returns:
+        list: Two row dictionaries, one per team.
+    """
+    parts = []
+    home_score = visitor_score = np.nan
+
+    with open_game_stream(path) as f:
+        stream = EventStream(f)
+        for event in stream:
+            parts.append(MomentArrays.from_event(event))
+            home_score = event.get('home_score', home_score)
+            visitor_score = event.get('visitor_score', visitor_score)
+
+    if not parts:
+        raise ValueError(f"No events found in {path}")
+
+    arrays = MomentArrays.concatenate(parts).drop_repeated()
+    home_id, visitor_id = arrays.home_id, arrays.visitor_id
+
+    left_side = arrays.ball[:, 0] < HALF_COURT_X
+    half_court = arrays.valid & ((arrays.players[..., 0] < HALF_COURT_X) == left_side[:, None]).all(axis=1)
+    baskets = np.where(left_side[:, None], LEFT_BASKET, RIGHT_BASKET)
+    distances = np.linalg.norm(arrays.players - baskets[:, None, :], axis=2)
+    home_defending = (distances[:, :PLAYERS_PER_TEAM].mean(axis=1)
+                      < distances[:, PLAYERS_PER_TEAM:].mean(axis=1))[half_court]
+
+    home_areas = team_hull_areas(arrays.home[half_court])
+    visitor_areas = team_hull_areas(arrays.visitor[half_court])
+    areas = {
+        home_id: {'offense': home_areas[~home_defending], 'defense': home_areas[home_defending]},
+        visitor_id: {'offense': visitor_areas[home_defending], 'defense': visitor_areas[~home_defending]},
+    }
+
+    rows = []
+    for team_id, opponent_id, is_home in ((home_id, visitor_id, True), (visitor_id, home_id, False)):
+        team_areas = areas[team_id]
+        rows.append({
+            'source': source,
+            'game_id': stream.header.get('gameid'),
+            'game_date': stream.header.get('gamedate'),
+            'team': Team(team_id).name,
+            'opponent': Team(opponent_id).name,
+            'is_home': is_home,
+            'offense_area': team_areas['offense'].mean() if team_areas['offense'].size else np.nan,
+            'defense_area': team_areas['defense'].mean() if team_areas['defense'].size else np.nan,
+            'offense_moments': len(team_areas['offense']),
+            'defense_moments': len(team_areas['defense']),
+            'score_diff': (home_score - visitor_score) * (1 if is_home else -1),
+            'metric_version': METRIC_VERSION,
+        })
+    return rows
+
+
+class SpacingStore:
+    """
+    A season-level table of per-game, per-team spacing statistics persisted as CSV.
+    """
+
+    columns = ['source', 'game_id', 'game_date', 'team', 'opponent', 'is_home',
+               'offense_area', 'defense_area', 'offense_moments', 'defense_moments',
+               'score_diff', 'metric_version']
+
+    def __init__(self, path='spacing_store.csv'):
+        self.path = path
+        if os.path.exists(path):
+            self.table = pd.read_csv(path, dtype={'game_id': str})
+        else:
+            self.table = pd.DataFrame(columns=self.columns)
+
+    def is_current(self, source):
+        """Whether a game archive is already stored under the current metric version"""
+        stored = self.table[self.table['source'] == source]
+        return not stored.empty and (stored['metric_version'] == METRIC_VERSION).all()
+
+    def update(self, archive_paths, force=False):
+        """
+        Add games that are missing or were computed with an older metric version.
+
+        Args:
+            archive_paths (list): Paths to game .7z or .json files.
+            force (bool): Recompute every game even if it is already current.
+        """
+        for path in archive_paths:
+            source = os.path.basename(path)
+            if not force and self.is_current(source):
+                continue
+            try:
+                rows = get_game_spacing_rows(path, source)
+            except Exception as e:
+                print(f"Error processing game {path}: {e}")
+                continue
+
+            rows = pd.DataFrame(rows, columns=self.columns)
+            # SportVU logs carry no scores, so scores filled into the table survive a recompute
+            stored_scores = self.table[self.table['source'] == source].set_index('team')['score_diff']
+            rows['score_diff'] = rows['score_diff'].fillna(rows['team'].map(stored_scores))
+            self.table = pd.concat([self.table[self.table['source'] != source], rows], ignore_index=True)
+            # Saving per game keeps finished work if a later archive fails badly
+            self.save()
+            print(f"Stored spacing for {source}")
+
+    def save(self):
+        self.table.to_csv(self.path, index=False)
+
+    def current(self):
+        """Rows computed with the current metric definition"""
+        return self.table[self.table['metric_version'] == METRIC_VERSION]
+
+    def defensive_spacing_by_team(self):
+        """
+        Average hull area of each team's opponents while they defend it, weighted by moments.
+
+        Returns:
+            pd.Series: Opponent's defensive spacing indexed by team abbreviation.
+        """
+        table = self.current()
+        opponents = table.merge(table, left_on=['source', 'opponent'], right_on=['source', 'team'],
+                                suffixes=('', '_opponent'))
+        opponents = opponents.dropna(subset=['defense_area_opponent'])
+        weighted = opponents['defense_area_opponent'] * opponents['defense_moments_opponent']
+        totals = weighted.groupby(opponents['team']).sum()
+        return (totals / opponents.groupby('team')['defense_moments_opponent'].sum()).astype(float)
+
+    def game_differentials(self):
+        """
+        Home team defensive spacing and score differentials, one row per game.
+
+        Returns:
+            pd.DataFrame: Columns 'home_defensive_spacing_diff' and 'home_score_diff'.
+        """
+        table = self.current()
+        games = table[table['is_home'].astype(bool)].merge(
+            table[~table['is_home'].astype(bool)], on='source', suffixes=('_home', '_visitor'))
+        return pd.DataFrame({
+            'home_defensive_spacing_diff': games['defense_area_home'] - games['defense_area_visitor'],
+            'home_score_diff': games['score_diff_home'],
+        }).dropna()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Add games to the season spacing table.')
+    parser.add_argument('--path', type=str, nargs='+', required=True,
+                        help='Game .7z/.json files or directories of them')
+    parser.add_argument('--store', type=str, default='spacing_store.csv', help='Path of the spacing table')
+    parser.add_argument('--force', action='store_true', help='Recompute games that are already stored')
+
+    args = parser.parse_args()
+
+    try:
+        archives = find_archives(args.path)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+
+    store = SpacingStore(args.store)
+    store.update(archives, force=args.force)
+    print(store.defensive_spacing_by_team().sort_values())
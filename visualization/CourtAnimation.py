@@ -0,0 +1,78 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.patches import Circle
+from PIL import Image
+from Settings import Settings
+
+
+class CourtAnimation:
+    """A base class for drawing moments on the court as one circle per player and one for the ball"""
+
+    court_array = None
+
+    @classmethod
+    def court_image(cls):
+        """Decode the court image once and share it between every figure"""
+        if cls.court_array is None:
+            try:
+                cls.court_array = np.asarray(Image.open("../court_converted.jpeg"))
+            except Exception as e:
+                print(f"Error loading and displaying the court image: {e}")
+        return cls.court_array
+
+    @staticmethod
+    def clock_text(moment):
+        return 'Quarter {:d}\n {:02d}:{:02d}\n {:03.1f}'.format(
+            moment.quarter,
+            int(moment.game_clock) % 3600 // 60,
+            int(moment.game_clock) % 60,
+            moment.shot_clock if moment.shot_clock is not None else 0
+        )
+
+    def build_court(self, player_colors, player_labels):
+        """
+        Create the court figure with its clock, player circles, jersey labels and ball.
+
+        Args:
+            player_colors (list): Color of each of the ten player circles.
+            player_labels (list): Initial jersey label of each player circle.
+
+        Returns:
+            tuple: (fig, ax, player_circles, ball_circle, annotations, clock_info)
+        """
+        fig, ax = plt.subplots()
+        ax.set_xlim(Settings.MIN_X, Settings.MAX_X)
+        ax.set_ylim(Settings.MIN_Y, Settings.MAX_Y)
+        ax.axis('off')
+        ax.grid(False)
+
+        clock_info = ax.annotate('', xy=[Settings.CENTER_X, Settings.CENTER_Y],
+                                 color='black', horizontalalignment='center',
+                                 verticalalignment='center')
+
+        annotations = [ax.annotate(label, xy=[0, 0], color='w', horizontalalignment='center',
+                                   verticalalignment='center', fontweight='bold')
+                       for label in player_labels]
+        player_circles = [Circle((0, 0), Settings.PLAYER_SIZE_RATIO, color=color) for color in player_colors]
+        ball_circle = Circle((0, 0), Settings.PLAYER_SIZE_RATIO, color='#ff8c00')
+
+        for circle in player_circles:
+            ax.add_patch(circle)
+        ax.add_patch(ball_circle)
+
+        court_array = self.court_image()
+        if court_array is not None:
+            ax.imshow(court_array, zorder=0, extent=[Settings.MIN_X, Settings.MAX_X - Settings.OFFSET,
+                                                     Settings.MAX_Y, Settings.MIN_Y])
+        return fig, ax, player_circles, ball_circle, annotations, clock_info
+
+    def draw_moment(self, moment, player_circles, ball_circle, annotations, clock_info):
+        """Move the circles, labels and clock to one moment"""
+        for j, circle in enumerate(player_circles):
+            circle.center = moment.players[j].x, moment.players[j].y
+            annotations[j].set_position(circle.center)
+        clock_info.set_text(self.clock_text(moment))
+
+        ball_circle.center = moment.ball.x, moment.ball.y
+        ball_circle.radius = moment.ball.radius / Settings.SCALING_FACTOR
+        return player_circles, ball_circle
@@ -0,0 +1,49 @@
+import threading
+
+
+class MomentBuffer:
+    """A fixed-size ring buffer of moments shared by a loader thread and the animation"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def put(self, moment):
+        """Store a moment, blocking while the buffer is full"""
+        with self._condition:
+            while self._size == self.capacity and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                return False
+            self._slots[(self._head + self._size) % self.capacity] = moment
+            self._size += 1
+            self._condition.notify_all()
+            return True
+
+    def get(self):
+        """Take the oldest moment, blocking while the buffer is empty; None once drained and closed"""
+        with self._condition:
+            while self._size == 0 and not self._closed:
+                self._condition.wait()
+            if self._size == 0:
+                return None
+            moment = self._slots[self._head]
+            self._slots[self._head] = None
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+            self._condition.notify_all()
+            return moment
+
+    def close(self):
+        """Mark the end of the stream so readers drain the buffer and stop"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __len__(self):
+        with self._condition:
+            return self._size
@@ -0,0 +1,95 @@
+import threading
+import matplotlib.pyplot as plt
+from matplotlib import animation
+from Settings import Settings
+from Moment import Moment
+from MomentBuffer import MomentBuffer
+from CourtAnimation import CourtAnimation
+from moment_arrays import MomentArrays
+from event_stream import iter_events
+
+
+class Playback(CourtAnimation):
+    """A class for continuous playback of consecutive events through a bounded moment buffer"""
+
+    def __init__(self, json_path, start_event=0, end_event=None, quarter=None,
+                 capacity=Settings.BUFFER_CAPACITY):
+        self.json_path = json_path
+        self.start_event = start_event
+        self.end_event = end_event
+        self.quarter = quarter
+        self.buffer = MomentBuffer(capacity)
+        self.player_ids_dict = {}
+        self.loader = None
+
+    def load_moments(self):
+        """Stream the selected events into the buffer, dropping frames repeated across events"""
+        last_timestamp = None
+        try:
+            for index, event in enumerate(iter_events(self.json_path, Settings.CHUNK_SIZE)):
+                if index < self.start_event:
+                    continue
+                if self.end_event is not None and index > self.end_event:
+                    return
+
+                players = event['home']['players'] + event['visitor']['players']
+                self.player_ids_dict.update({
+                    player['playerid']: (" ".join([player['firstname'], player['lastname']]), player['jersey'])
+                    for player in players
+                })
+
+                if self.quarter is not None and event['moments']:
+                    # Events outside the quarter are skipped from their end points before they are packed
+                    if event['moments'][0][0] > self.quarter:
+                        return
+                    if event['moments'][-1][0] < self.quarter:
+                        continue
+
+                arrays = MomentArrays.from_event(event).repair()
+                keep = arrays.valid if self.quarter is None else arrays.valid & (arrays.quarter == self.quarter)
+                # Consecutive events overlap in time, so only moments past the last one shown are kept
+                arrays = arrays.take(keep).drop_repeated(after=last_timestamp)
+                for moment_index in range(len(arrays)):
+                    if not self.buffer.put(Moment(arrays.to_moment(moment_index))):
+                        return
+                if len(arrays):
+                    last_timestamp = arrays.timestamp[-1]
+        finally:
+            self.buffer.close()
+
+    def start(self):
+        """Start filling the buffer from a background thread"""
+        self.loader = threading.Thread(target=self.load_moments, daemon=True)
+        self.loader.start()
+
+    def frames(self):
+        """Yield buffered moments until the loader has finished and the buffer is drained"""
+        while True:
+            moment = self.buffer.get()
+            if moment is None:
+                return
+            yield moment
+
+    def update_visuals(self, moment, player_circles, ball_circle, annotations, clock_info):
+        # Lineups change between events, so colors and jerseys follow each moment's players
+        for j, circle in enumerate(player_circles):
+            circle.set_color(moment.players[j].color)
+            annotations[j].set_text(self.player_ids_dict.get(moment.players[j].id, ('', ''))[1])
+        return self.draw_moment(moment, player_circles, ball_circle, annotations, clock_info)
+
+    def display(self):
+        self.start()
+
+        fig, ax, player_circles, ball_circle, annotations, clock_info = self.build_court(
+            [None] * 10, [''] * 10)
+
+        # Closing the window releases a loader blocked on a full buffer
+        fig.canvas.mpl_connect('close_event', lambda event: self.buffer.close())
+
+        # Frame caching would keep every moment alive and defeat the bounded buffer
+        anim = animation.FuncAnimation(
+            fig, self.update_visuals, frames=self.frames,
+            fargs=(player_circles, ball_circle, annotations, clock_info),
+            interval=Settings.REFRESH_RATE, repeat=False, cache_frame_data=False)
+
+        plt.show()
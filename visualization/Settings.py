@@ -13,4 +13,10 @@ class Settings:
     FONT_SIZE = 6
     CENTER_X = MAX_X / 2 - OFFSET / 1.5 + 0.10
     CENTER_Y = MAX_Y - OFFSET / 1.5 - 0.35
+    BUFFER_CAPACITY = 250
+    CHUNK_SIZE = 1 << 16
+    FRAME_RATE = 25
+    PANEL_WIDTH = 5
+    PANEL_PLAYER_SIZE = 40
+    PANEL_BALL_SIZE = 15
     NOTIFICATION = 'Re-execute the script and select an event from 0 to '
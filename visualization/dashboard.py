@@ -0,0 +1,186 @@
+import argparse
+import math
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import animation
+from matplotlib.colors import to_rgba
+from matplotlib.patches import Polygon
+from scipy.spatial import ConvexHull, QhullError
+from Settings import Settings
+from Team import Team
+from CourtAnimation import CourtAnimation
+from moment_arrays import MomentArrays, PLAYERS_PER_TEAM
+from event_stream import iter_events
+
+TEAM_ALIASES = {'away': 'visitor'}
+
+
+class DashboardPanel:
+    """A class for keeping one event's moments as arrays for a dashboard panel"""
+
+    def __init__(self, event, event_number, team_name):
+        arrays = MomentArrays.from_event(event).repair()
+        arrays = arrays.take(arrays.valid)
+        home_team = Team(arrays.home_id)
+        guest_team = Team(arrays.visitor_id)
+        self.label = f'{guest_team.name} at {home_team.name} - event {event_number}'
+
+        self.ball = arrays.ball[:, :2]
+        self.players = arrays.players
+        self.clocks = list(zip(arrays.quarter.tolist(), arrays.game_clock.tolist(),
+                               [None if np.isnan(clock) else clock for clock in arrays.shot_clock]))
+
+        # Home players always fill the first five slots, so the hull team is a fixed slice
+        self.hull_slice = slice(None, PLAYERS_PER_TEAM) if team_name == 'home' else slice(PLAYERS_PER_TEAM, None)
+
+        # Slots never change team, so colors are set once instead of every tick
+        colors = [to_rgba(home_team.color)] * PLAYERS_PER_TEAM + [to_rgba(guest_team.color)] * PLAYERS_PER_TEAM
+        self.colors = np.array(colors + [to_rgba('#ff8c00')])
+
+    def __len__(self):
+        return len(self.clocks)
+
+
+class Dashboard:
+    """A class for playing many events side by side in one synchronized figure"""
+
+    def __init__(self, panel_events, team_name='home'):
+        self.panel_events = panel_events
+        # 'away' is accepted as the README's name for the visitor team
+        self.team_name = TEAM_ALIASES.get(team_name.lower(), team_name.lower())
+        if self.team_name not in ('home', 'visitor'):
+            raise ValueError(f"team_name must be 'home' or 'visitor', got '{team_name}'")
+        self.panels = []
+
+    def load_data(self):
+        """Load the requested (path, event_number) pairs with one streaming pass per game"""
+        wanted = {}
+        for path, event_number in self.panel_events:
+            wanted.setdefault(path, set()).add(event_number)
+
+        loaded = {}
+        for path, event_numbers in wanted.items():
+            last_event = max(event_numbers)
+            for index, event in enumerate(iter_events(path, Settings.CHUNK_SIZE)):
+                if index in event_numbers:
+                    loaded[(path, index)] = DashboardPanel(event, index, self.team_name)
+                if index >= last_event:
+                    break
+
+        for key in self.panel_events:
+            if key not in loaded or len(loaded[key]) == 0:
+                print(f"Skipping event {key[1]} of {key[0]}: no playable moments")
+                continue
+            self.panels.append(loaded[key])
+
+    def _build_figure(self):
+        count = len(self.panels)
+        cols = math.ceil(math.sqrt(count))
+        rows = math.ceil(count / cols)
+        fig, axes = plt.subplots(rows, cols, squeeze=False,
+                                 figsize=(cols * Settings.PANEL_WIDTH, rows * Settings.PANEL_WIDTH / 2))
+        court_array = CourtAnimation.court_image()
+        sizes = [Settings.PANEL_PLAYER_SIZE] * 10 + [Settings.PANEL_BALL_SIZE]
+
+        artists = []
+        for ax, panel in zip(axes.flat, self.panels):
+            if court_array is not None:
+                ax.imshow(court_array, zorder=0, extent=[Settings.MIN_X, Settings.MAX_X - Settings.OFFSET,
+                                                         Settings.MAX_Y, Settings.MIN_Y])
+            ax.set_xlim(Settings.MIN_X, Settings.MAX_X)
+            ax.set_ylim(Settings.MIN_Y, Settings.MAX_Y)
+            ax.axis('off')
+            ax.set_title(panel.label, fontsize=Settings.FONT_SIZE)
+
+            hull_patch = Polygon([[0, 0]], alpha=0.3, color='gray', zorder=1)
+            ax.add_patch(hull_patch)
+            collection = ax.scatter(np.zeros(11), np.zeros(11), s=sizes, c=panel.colors, zorder=2)
+            clock_info = ax.text(Settings.CENTER_X, Settings.CENTER_Y, '', color='black', ha='center',
+                                 va='center', fontsize=Settings.FONT_SIZE)
+            artists.append((collection, hull_patch, clock_info))
+
+        for ax in axes.flat[count:]:
+            ax.axis('off')
+        fig.tight_layout()
+        return fig, artists
+
+    def update_visuals(self, frame, artists):
+        """Advance every panel to the same frame; shorter events hold their last moment"""
+        updated = []
+        for panel, (collection, hull_patch, clock_info) in zip(self.panels, artists):
+            index = min(frame, len(panel) - 1)
+            collection.set_offsets(np.vstack([panel.players[index], panel.ball[index]]))
+
+            team_positions = panel.players[index, panel.hull_slice]
+            try:
+                hull = ConvexHull(team_positions)
+                hull_patch.set_xy(team_positions[hull.vertices])
+            except QhullError:
+                # Collinear or stacked players have no area; hide the hull for this frame
+                hull_patch.set_xy([[0, 0]])
+
+            quarter, game_clock, shot_clock = panel.clocks[index]
+            clock_info.set_text('Q{:d} {:02d}:{:02d} {:03.1f}'.format(
+                quarter,
+                int(game_clock) % 3600 // 60,
+                int(game_clock) % 60,
+                shot_clock if shot_clock is not None else 0
+            ))
+            updated += [collection, hull_patch, clock_info]
+        return updated
+
+    def _animation(self):
+        if not self.panels:
+            raise ValueError("No playable events to show on the dashboard")
+        fig, artists = self._build_figure()
+        frames = max(len(panel) for panel in self.panels)
+        # Blitting keeps the court backgrounds cached and redraws only the moving artists
+        anim = animation.FuncAnimation(
+            fig, self.update_visuals, frames=frames, fargs=(artists,),
+            interval=1000 / Settings.FRAME_RATE, blit=True, repeat=False)
+        return fig, anim
+
+    def display(self):
+        fig, anim = self._animation()
+        plt.show()
+
+    def save(self, output_path):
+        """Render the dashboard to a .gif or a video file without opening a window"""
+        fig, anim = self._animation()
+        if output_path.endswith('.gif'):
+            writer = animation.PillowWriter(fps=Settings.FRAME_RATE)
+        else:
+            writer = animation.FFMpegWriter(fps=Settings.FRAME_RATE)
+        anim.save(output_path, writer=writer)
+        plt.close(fig)
+
+
+def parse_panel(value):
+    """Split a 'path:event' argument into the game path and event index"""
+    path, separator, event = value.rpartition(':')
+    if not separator or not path or not event.isdigit():
+        raise argparse.ArgumentTypeError(f"expected <path>:<event>, got '{value}'")
+    return path, int(event)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Play several events or games side by side.')
+    parser.add_argument('--panel', type=parse_panel, nargs='+', required=True,
+                        help='Events to show as <game .7z or JSON path>:<event index>, one per panel')
+    parser.add_argument('--team', type=str.lower, default='home', choices=['home', 'visitor', 'away'],
+                        help='Team whose hull is drawn (away is the same as visitor)')
+    parser.add_argument('--save', type=str, default=None,
+                        help='Write the dashboard to this .gif or video file instead of showing it')
+
+    args = parser.parse_args()
+
+    if args.save:
+        plt.switch_backend('Agg')
+
+    dashboard = Dashboard(args.panel, team_name=args.team)
+    dashboard.load_data()
+
+    if args.save:
+        dashboard.save(args.save)
+    else:
+        dashboard.display()
@@ -0,0 +1,162 @@
+import codecs
+import os
+import json
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+import py7zr
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class EventStream:
+    """A class for reading game events one at a time from a SportVU JSON stream"""
+
+    def __init__(self, stream, chunk_size=1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.header = {}
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+
+    def _read_more(self, size=None):
+        """Append the next chunk of the stream to the buffer, returning False at EOF"""
+        if self._eof:
+            return False
+        chunk = self.stream.read(size or self.chunk_size)
+        if isinstance(chunk, bytes):
+            if not chunk:
+                self._eof = True
+                return False
+            # Multi-byte characters may be split across decompressor chunks
+            chunk = self._utf8.decode(chunk)
+            if not chunk:
+                return True
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """Skip whitespace and return the next character without consuming it"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self._pos} of the JSON buffer")
+        self._pos += 1
+
+    def _decode_value(self):
+        """Decode one JSON value, growing the buffer until the value is complete"""
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+                # A number touching the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Read at least as much as is buffered so retries stay amortized linear
+            self._read_more(max(self.chunk_size, len(self._buffer) - self._pos))
+
+    def __iter__(self):
+        """Yield each event of the game while collecting the other top-level keys in header"""
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(':')
+            if key == 'events':
+                self._expect('[')
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._decode_value()
+                        if self._peek() == ']':
+                            self._pos += 1
+                            break
+                        self._expect(',')
+            else:
+                self.header[key] = self._decode_value()
+            if self._peek() == '}':
+                return
+            self._expect(',')
+
+
+@contextmanager
+def open_game_stream(path):
+    """Open a game .json or .7z file as a byte stream, decompressing on the fly when 7z is installed"""
+    if not path.endswith('.7z'):
+        with open(path, 'rb') as f:
+            yield f
+        return
+
+    executable = shutil.which('7za') or shutil.which('7z')
+    if executable:
+        # stderr goes to a temporary file so a chatty 7z can never block on a full pipe
+        with tempfile.TemporaryFile() as errors:
+            process = subprocess.Popen([executable, 'e', '-so', path, '*.json', '-r'],
+                                       stdout=subprocess.PIPE, stderr=errors)
+            try:
+                yield process.stdout
+            finally:
+                # Output left unread means the consumer stopped early, which is not an archive error
+                stopped_early = bool(process.stdout.read(1))
+                process.stdout.close()
+                if stopped_early:
+                    process.kill()
+                process.wait()
+                if not stopped_early and process.returncode != 0:
+                    errors.seek(0)
+                    message = errors.read().decode('utf-8', 'replace').strip()
+                    # Raised from finally so it replaces the JSON error a truncated stream causes
+                    raise RuntimeError(f"7z failed on {path} (exit code {process.returncode}): {message}")
+        return
+
+    # Without the 7z binary the game is extracted to a temporary directory and streamed from disk
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with py7zr.SevenZipFile(path, mode='r') as archive:
+            archive.extractall(path=temp_dir)
+        json_files = [os.path.join(root, file) for root, _, files in os.walk(temp_dir)
+                      for file in files if file.endswith('.json')]
+        if not json_files:
+            raise FileNotFoundError("No JSON file found inside the .7z archive")
+        with open(json_files[0], 'rb') as f:
+            yield f
+
+
+def find_archives(paths):
+    """Expand directories into the .7z and .json game files they contain, rejecting missing paths"""
+    archives = []
+    for path in paths:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No game file or directory at {path}")
+        if os.path.isdir(path):
+            archives += sorted(os.path.join(path, name) for name in os.listdir(path)
+                               if name.endswith(('.7z', '.json')))
+        else:
+            archives.append(path)
+    return archives
+
+
+def iter_events(path, chunk_size=1 << 16):
+    """Yield the events of a game .json or .7z file without loading the whole game"""
+    with open_game_stream(path) as f:
+        yield from EventStream(f, chunk_size)
@@ -4,6 +4,7 @@ import py7zr
 import json
 import tempfile
 from Play import Play
+from Playback import Playback
 
 def extract_7z_and_get_json(archive_path):
     temp_dir = tempfile.mkdtemp()
@@ -33,9 +34,20 @@ def main():
                         help="""Index of the event to animate
                                 (Index starts at 0, and if the index is out of bounds,
                                 the last event of the game will be shown)""")
+    parser.add_argument('--through-event', type=int, default=None,
+                        help='Play every event from --event up to and including this index as one clip')
+    parser.add_argument('--quarter', type=int, default=None,
+                        help='Play the whole quarter as one continuous clip')
 
     args = parser.parse_args()
 
+    if args.through_event is not None or args.quarter is not None:
+        # Playback streams .7z archives directly, so nothing is extracted to disk
+        playback = Playback(json_path=args.path, start_event=args.event,
+                            end_event=args.through_event, quarter=args.quarter)
+        playback.display()
+        return
+
     if args.path.endswith(".7z"):
         json_file_path = extract_7z_and_get_json(args.path)
     else:
@@ -0,0 +1,308 @@
+from itertools import combinations
+import numpy as np
+
+BALL_TEAM_ID = -1
+PLAYERS_PER_TEAM = 5
+PLAYER_SLOTS = 2 * PLAYERS_PER_TEAM
+COURT_LENGTH = 94
+COURT_WIDTH = 50
+COURT_MARGIN = 10
+HALF_COURT_X = 47
+LEFT_BASKET = (5.25, 25)
+RIGHT_BASKET = (88.75, 25)
+# Longest run of missing frames (1 second at 25 Hz) bridged by repair()
+MAX_REPAIR_GAP = 25
+
+ANOMALIES = ['repeated_moments', 'missing_ball', 'extra_balls', 'unknown_team', 'duplicate_players',
+             'missing_players', 'extra_players', 'out_of_bounds']
+FIELDS = ['quarter', 'timestamp', 'game_clock', 'shot_clock', 'ball', 'ball_valid',
+          'players', 'player_ids', 'player_valid', 'overflow']
+
+
+def _moments_with(keys, flags):
+    """Number of distinct moments among the entries that raised a flag"""
+    return int(np.unique(keys[flags]).size)
+
+
+def _forward_fill(values, valid, quarter, ids=None):
+    """
+    Carry the last valid value forward over short gaps inside a quarter.
+
+    With ids, a gap is only bridged when the same player holds the slot on both sides of it
+    and the whole gap is short, so a player who left is never replaced by a copy of themselves.
+
+    Args:
+        values (np.ndarray): Array whose leading axes match valid.
+        valid (np.ndarray): (T,) or (T, slots) mask of observed values.
+        quarter (np.ndarray): (T,) quarter of every moment.
+        ids (np.ndarray): Optional (T, slots) player id of every slot.
+
+    Returns:
+        np.ndarray: Mask of the entries that were filled.
+    """
+    count = len(valid)
+    steps = np.arange(count).reshape((-1,) + (1,) * (valid.ndim - 1))
+    quarter = np.broadcast_to(quarter.reshape(steps.shape), valid.shape)
+    last = np.maximum.accumulate(np.where(valid, steps, -1), axis=0)
+    source = np.maximum(last, 0)
+    filled = (~valid & (last >= 0) & (steps - last <= MAX_REPAIR_GAP)
+              & (np.take_along_axis(quarter, source, axis=0) == quarter))
+    if ids is not None:
+        following = np.flip(np.minimum.accumulate(np.flip(np.where(valid, steps, count), axis=0), axis=0), axis=0)
+        target = np.minimum(following, count - 1)
+        filled &= ((following < count) & (following - last - 1 <= MAX_REPAIR_GAP)
+                   & (np.take_along_axis(quarter, target, axis=0) == quarter)
+                   & (np.take_along_axis(ids, source, axis=0) == np.take_along_axis(ids, target, axis=0)))
+    if valid.ndim == 1:
+        values[filled] = values[source[filled]]
+    else:
+        rows, cols = np.nonzero(filled)
+        values[rows, cols] = values[source[rows, cols], cols]
+    return filled
+
+
+def _assign_slots(owner, ids, visitor):
+    """
+    Keep every player in the same slot for as long as they stay on the floor.
+
+    Slots are only worked out again where a team's lineup changes: players still on the floor
+    keep theirs, returning players get their last slot back when it is free, and new players
+    take the lowest free slots in listing order.
+
+    Args:
+        owner (np.ndarray): Moment index of every player entry, in listing order.
+        ids (np.ndarray): Player id of every entry.
+        visitor (np.ndarray): Whether every entry belongs to the visitor team.
+
+    Returns:
+        np.ndarray: Slot of every entry, or -1 for players beyond a full team.
+    """
+    slots = np.full(ids.size, -1, dtype=int)
+    for is_visitor in (False, True):
+        rows = np.flatnonzero(visitor == is_visitor)
+        if not rows.size:
+            continue
+        _, starts, counts = np.unique(owner[rows], return_index=True, return_counts=True)
+        row_moment = np.repeat(np.arange(starts.size), counts)
+        lineups = np.full((starts.size, counts.max()), -1, dtype=np.int64)
+        lineups[row_moment, np.arange(rows.size) - starts[row_moment]] = ids[rows]
+        lineups.sort(axis=1)
+        changed = np.ones(starts.size, dtype=bool)
+        changed[1:] = (lineups[1:] != lineups[:-1]).any(axis=1)
+        lineup_index = np.cumsum(changed) - 1
+
+        lineup_slots = np.full((int(changed.sum()), lineups.shape[1]), -1, dtype=int)
+        current, last_slot = {}, {}
+        for index, moment in enumerate(np.flatnonzero(changed)):
+            listed = ids[rows[starts[moment]:starts[moment] + counts[moment]]].tolist()
+            kept = {player: current[player] for player in listed if player in current}
+            free = [slot for slot in range(PLAYERS_PER_TEAM) if slot not in kept.values()]
+            for player in listed:
+                if player not in kept and last_slot.get(player) in free:
+                    kept[player] = last_slot[player]
+                    free.remove(kept[player])
+            for player in listed:
+                if player not in kept and free:
+                    kept[player] = free.pop(0)
+            current = kept
+            last_slot.update(kept)
+            lineup_slots[index] = [kept.get(player, -1) for player in lineups[moment].tolist()]
+
+        # Lineups are sorted by id, so each entry finds its column by matching its id
+        columns = (lineups[row_moment] == ids[rows][:, None]).argmax(axis=1)
+        team_slots = lineup_slots[lineup_index[row_moment], columns]
+        slots[rows] = np.where(team_slots >= 0, team_slots + PLAYERS_PER_TEAM * is_visitor, -1)
+    return slots
+
+
+class MomentArrays:
+    """
+    A class for keeping a game's moments in fixed-shape arrays with validity masks.
+
+    Players are stored with the home team in slots 0-4 and the visitor team in slots 5-9,
+    so team splits are plain slices and every moment has the same shape. Within an event a
+    player keeps the same slot from frame to frame, whatever order the moments list them in.
+    """
+
+    def __init__(self, home_id, visitor_id, fields, anomalies):
+        self.home_id = home_id
+        self.visitor_id = visitor_id
+        for name in FIELDS:
+            setattr(self, name, fields[name])
+        self.anomalies = anomalies
+        self.repaired = {'ball': 0, 'players': 0}
+        self._update_valid()
+
+    @classmethod
+    def from_moments(cls, moments, home_id, visitor_id):
+        """Pack raw SportVU moments and count their anomalies in one vectorized pass"""
+        count = len(moments)
+        lengths = np.array([len(moment[5]) for moment in moments], dtype=int)
+        entries = np.array([entry[:5] for moment in moments for entry in moment[5]], dtype=float).reshape(-1, 5)
+        owner = np.repeat(np.arange(count), lengths)
+        anomalies = dict.fromkeys(ANOMALIES, 0)
+
+        fields = {
+            'quarter': np.array([moment[0] for moment in moments], dtype=int),
+            'timestamp': np.array([moment[1] for moment in moments], dtype=np.int64),
+            'game_clock': np.array([moment[2] for moment in moments], dtype=float),
+            'shot_clock': np.array([np.nan if moment[3] is None else moment[3] for moment in moments], dtype=float),
+            'ball': np.zeros((count, 3)),
+            'ball_valid': np.zeros(count, dtype=bool),
+            'players': np.zeros((count, PLAYER_SLOTS, 2)),
+            'player_ids': np.zeros((count, PLAYER_SLOTS), dtype=np.int64),
+            'player_valid': np.zeros((count, PLAYER_SLOTS), dtype=bool),
+            'overflow': np.zeros(count, dtype=bool),
+        }
+
+        # The first ball entry of a moment wins
+        is_ball = entries[:, 0] == BALL_TEAM_ID
+        ball_rows = np.flatnonzero(is_ball)
+        ball_owners, first_ball = np.unique(owner[ball_rows], return_index=True)
+        fields['ball'][ball_owners] = entries[ball_rows[first_ball], 2:5]
+        fields['ball_valid'][ball_owners] = True
+        anomalies['missing_ball'] = int(count - ball_owners.size)
+        anomalies['extra_balls'] = int(ball_rows.size - first_ball.size)
+
+        rows = np.flatnonzero(~is_ball)
+        team = entries[rows, 0]
+        known = (team == home_id) | (team == visitor_id)
+        anomalies['unknown_team'] = _moments_with(owner[rows], ~known)
+        rows = rows[known]
+
+        # A player listed twice in one moment keeps the first listed position
+        keys = owner[rows] * (int(entries[rows, 1].max(initial=0)) + 1) + entries[rows, 1].astype(np.int64)
+        first_listing = np.zeros(rows.size, dtype=bool)
+        first_listing[np.unique(keys, return_index=True)[1]] = True
+        anomalies['duplicate_players'] = _moments_with(owner[rows], ~first_listing)
+        rows = rows[first_listing]
+
+        visitor = entries[rows, 0] == visitor_id
+        team_sizes = np.bincount(owner[rows] * 2 + visitor, minlength=2 * count).reshape(count, 2)
+        # Moments with an overflowing team are ambiguous, so they never count as valid
+        fields['overflow'] = (team_sizes > PLAYERS_PER_TEAM).any(axis=1)
+        anomalies['extra_players'] = int(fields['overflow'].sum())
+
+        ids = entries[rows, 1].astype(np.int64)
+        slots = _assign_slots(owner[rows], ids, visitor)
+        fits = slots >= 0
+        placed, slots = rows[fits], slots[fits]
+        fields['players'][owner[placed], slots] = entries[placed, 2:4]
+        fields['player_ids'][owner[placed], slots] = ids[fits]
+        fields['player_valid'][owner[placed], slots] = True
+
+        x, y = fields['players'][..., 0], fields['players'][..., 1]
+        outside = fields['player_valid'] & ((x < -COURT_MARGIN) | (x > COURT_LENGTH + COURT_MARGIN)
+                                            | (y < -COURT_MARGIN) | (y > COURT_WIDTH + COURT_MARGIN))
+        anomalies['out_of_bounds'] = int(outside.any(axis=1).sum())
+        fields['player_valid'] &= ~outside
+        anomalies['missing_players'] = int((~fields['player_valid'].all(axis=1)).sum())
+
+        return cls(home_id, visitor_id, fields, anomalies)
+
+    @classmethod
+    def from_event(cls, event):
+        return cls.from_moments(event['moments'], event['home']['teamid'], event['visitor']['teamid'])
+
+    @classmethod
+    def concatenate(cls, parts):
+        """Join per-event arrays of one game in order"""
+        if not parts:
+            raise ValueError("No moments to concatenate")
+        fields = {name: np.concatenate([getattr(part, name) for part in parts]) for name in FIELDS}
+        anomalies = {name: sum(part.anomalies[name] for part in parts) for name in ANOMALIES}
+        return cls(parts[0].home_id, parts[0].visitor_id, fields, anomalies)
+
+    @classmethod
+    def from_events(cls, events):
+        """Pack every event of a game, dropping the moments repeated across event boundaries"""
+        return cls.concatenate([cls.from_event(event) for event in events]).drop_repeated()
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    def _update_valid(self):
+        self.valid = self.ball_valid & self.player_valid.all(axis=1) & ~self.overflow
+
+    def take(self, index):
+        """Keep only the moments selected by a boolean mask or index array"""
+        fields = {name: getattr(self, name)[index] for name in FIELDS}
+        arrays = MomentArrays(self.home_id, self.visitor_id, fields, dict(self.anomalies))
+        arrays.repaired = dict(self.repaired)
+        return arrays
+
+    def drop_repeated(self, after=None):
+        """Keep moments whose timestamp moves past every moment before them and past after, if given"""
+        start = np.iinfo(np.int64).min if after is None else after
+        previous = np.maximum.accumulate(np.concatenate([[start], self.timestamp[:-1]]))
+        keep = self.timestamp > previous
+        arrays = self.take(keep)
+        arrays.anomalies['repeated_moments'] += int((~keep).sum())
+        return arrays
+
+    def repair(self):
+        """Fill short gaps in ball and player tracks from the previous frame of the same quarter and player"""
+        ball_filled = _forward_fill(self.ball, self.ball_valid, self.quarter)
+        self.ball_valid |= ball_filled
+        player_filled = _forward_fill(self.players, self.player_valid, self.quarter, self.player_ids)
+        _forward_fill(self.player_ids, self.player_valid, self.quarter, self.player_ids)
+        self.player_valid |= player_filled
+        self.repaired['ball'] += int(ball_filled.sum())
+        self.repaired['players'] += int(player_filled.sum())
+        self._update_valid()
+        return self
+
+    @property
+    def home(self):
+        return self.players[:, :PLAYERS_PER_TEAM]
+
+    @property
+    def visitor(self):
+        return self.players[:, PLAYERS_PER_TEAM:]
+
+    def to_moment(self, index):
+        """Rebuild a well-formed raw moment, ball first and home players before visitors"""
+        entries = [[BALL_TEAM_ID, BALL_TEAM_ID] + self.ball[index].tolist()]
+        for slot in range(PLAYER_SLOTS):
+            team_id = self.home_id if slot < PLAYERS_PER_TEAM else self.visitor_id
+            entries.append([team_id, int(self.player_ids[index, slot])] + self.players[index, slot].tolist() + [0])
+        shot_clock = None if np.isnan(self.shot_clock[index]) else float(self.shot_clock[index])
+        return [int(self.quarter[index]), int(self.timestamp[index]), float(self.game_clock[index]),
+                shot_clock, None, entries]
+
+    def report(self):
+        """Counts of moments, valid moments, anomalies and repaired values"""
+        summary = {'moments': len(self), 'valid': int(self.valid.sum())}
+        summary.update(self.anomalies)
+        summary.update({f'repaired_{name}': count for name, count in self.repaired.items()})
+        return summary
+
+
+_HULL_SUBSETS = [np.array(subset) for size in range(3, PLAYERS_PER_TEAM + 1)
+                 for subset in combinations(range(PLAYERS_PER_TEAM), size)]
+
+
+def team_hull_areas(positions):
+    """
+    Convex hull areas of one team for many moments at once.
+
+    Every subset of the points, ordered by angle around its centroid, forms a polygon inside
+    the hull, and the subset of hull vertices forms the hull itself, so the largest of these
+    polygon areas is the hull area.
+
+    Args:
+        positions (np.ndarray): (T, 5, 2) player positions.
+
+    Returns:
+        np.ndarray: (T,) hull areas.
+    """
+    areas = np.zeros(len(positions))
+    for subset in _HULL_SUBSETS:
+        points = positions[:, subset]
+        centered = points - points.mean(axis=1, keepdims=True)
+        order = np.argsort(np.arctan2(centered[..., 1], centered[..., 0]), axis=1)
+        ring = np.take_along_axis(points, order[..., None], axis=1)
+        following = np.roll(ring, -1, axis=1)
+        polygon = 0.5 * np.abs((ring[..., 0] * following[..., 1] - following[..., 0] * ring[..., 1]).sum(axis=1))
+        np.maximum(areas, polygon, out=areas)
+    return areas
@@ -5,20 +5,24 @@ import json
 import os
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.spatial import ConvexHull
+from scipy.spatial import ConvexHull, QhullError
 from matplotlib.patches import Polygon, Circle
 from matplotlib import animation
 from PIL import Image
 from Match import Match
 from Settings import Settings
-from Moment import Moment
+from Team import Team
+from moment_arrays import MomentArrays, PLAYERS_PER_TEAM
 
 class TeamSpacingVisualizer:
     def __init__(self, file_path, team_name):
         self.file_path = file_path
         self.team_name = team_name.lower()
+        # Home players always fill the first five slots, so the hull team is a fixed slice
+        self.hull_slice = slice(None, PLAYERS_PER_TEAM) if self.team_name == 'home' else slice(PLAYERS_PER_TEAM, None)
         self.data = None
-        self.moments = []
+        self.arrays = None
+        self.jerseys = None
         self.match = None
 
     def extract_7z_and_get_json(self):
@@ -45,60 +49,49 @@ class TeamSpacingVisualizer:
         with open(json_file) as f:
             self.data = json.load(f)
 
-        for event in self.data['events']:
-            self.moments.extend([Moment(moment) for moment in event['moments']])
-        
+        # Only validated moments reach the renderer, so every frame has a ball and five players a side
+        arrays = MomentArrays.from_events(self.data['events']).repair()
+        print(f"Moment validation: {arrays.report()}")
+        self.arrays = arrays.take(arrays.valid)
+
         event_data = self.data['events'][0]
         self.match = Match(event_data)
 
-    def get_positions_and_ball(self, moment):
-        """Extract the positions of all players and ball for a moment"""
-        home_positions = []
-        away_positions = []
-        ball_position = (moment.ball.x, moment.ball.y, moment.ball.radius)
-
-        for player in moment.players:
-            if player.team.id == moment.players[0].team.id:
-                home_positions.append((player.x, player.y))
-            else:
-                away_positions.append((player.x, player.y))
-
-        return home_positions, away_positions, ball_position
+        # Jersey labels follow the player ids of every slot, so they stay right across lineup changes
+        ids, slots = np.unique(self.arrays.player_ids, return_inverse=True)
+        labels = np.array([self.match.player_ids_dict.get(player_id, ('', ''))[1] for player_id in ids.tolist()])
+        self.jerseys = labels[slots].reshape(self.arrays.player_ids.shape)
 
     def update_visuals(self, frame, home_circles, away_circles, ball_circle, hull_patch, annotations, clock_info):
         """Update the positions of the players, ball, and convex hull for each frame."""
-        moment = self.moments[frame]
-        home_positions, away_positions, ball_position = self.get_positions_and_ball(moment)
+        for circle, annotation, position, jersey in zip(home_circles + away_circles, annotations,
+                                                        self.arrays.players[frame], self.jerseys[frame]):
+            circle.center = position
+            annotation.set_position(position)
+            annotation.set_text(jersey)
 
-       
-        for i, circle in enumerate(home_circles):
-            circle.center = home_positions[i]
-            annotations[i].set_position(circle.center)
-
-        
-        for i, circle in enumerate(away_circles):
-            circle.center = away_positions[i]
-            annotations[i + 5].set_position(circle.center)
-
-        ball_circle.center = ball_position[0], ball_position[1]
-        ball_circle.radius = ball_position[2] / 7
-        
-        team_positions = np.array(home_positions if self.team_name == 'home' else away_positions)
-        if len(team_positions) >= 3:
+        ball_circle.center = self.arrays.ball[frame, :2]
+        ball_circle.radius = self.arrays.ball[frame, 2] / 7
+
+        team_positions = self.arrays.players[frame, self.hull_slice]
+        try:
             hull = ConvexHull(team_positions)
             hull_patch.set_xy(team_positions[hull.vertices])
+        except QhullError:
+            # Collinear or stacked players have no area; hide the hull for this frame
+            hull_patch.set_xy([[0, 0]])
 
+        shot_clock = self.arrays.shot_clock[frame]
         clock_text = 'Quarter {:d}\n{:02d}:{:02d}\n{:03.1f}'.format(
-            moment.quarter,
-            int(moment.game_clock) // 60,
-            int(moment.game_clock) % 60,
-            moment.shot_clock if moment.shot_clock is not None else 0
+            int(self.arrays.quarter[frame]),
+            int(self.arrays.game_clock[frame]) // 60,
+            int(self.arrays.game_clock[frame]) % 60,
+            0 if np.isnan(shot_clock) else shot_clock
         )
         clock_info.set_text(clock_text)
 
         return home_circles + away_circles + [ball_circle, hull_patch] + [clock_info]
 
-
     def _draw_court(self, ax=None):
         """Draw the court layout with the court image as the background"""
         if ax is None:
@@ -122,49 +115,34 @@ class TeamSpacingVisualizer:
         fig, ax = plt.subplots()
         self._draw_court(ax)
 
-        start_moment = self.moments[0]
-        home_positions, away_positions, ball_position = self.get_positions_and_ball(start_moment)
-        home_positions = np.array(home_positions)
-        away_positions = np.array(away_positions)
+        if not len(self.arrays):
+            raise ValueError("The game has no moment with the ball and five players a side to display")
 
-        home_circles = [Circle((x, y), 1.5, color='blue') for x, y in home_positions]
-        away_circles = [Circle((x, y), 1.5, color='red') for x, y in away_positions]
+        home_circles = [Circle(position, 1.5, color='blue') for position in self.arrays.home[0]]
+        away_circles = [Circle(position, 1.5, color='red') for position in self.arrays.visitor[0]]
 
         for circle in home_circles + away_circles:
             ax.add_patch(circle)
 
-        ball_circle = Circle((ball_position[0], ball_position[1]), ball_position[2] / 7, color='orange')
+        ball_circle = Circle(self.arrays.ball[0, :2], self.arrays.ball[0, 2] / 7, color='orange')
         ax.add_patch(ball_circle)
 
-        team_positions = home_positions if self.team_name == 'home' else away_positions
-
         hull_patch = Polygon([[0, 0]], alpha=0.3, color='gray')
-
-        if len(team_positions) >= 3:
-            hull = ConvexHull(team_positions)
-            hull_patch = Polygon(team_positions[hull.vertices], alpha=0.3, color='gray')
-
         ax.add_patch(hull_patch)
 
-        player_dict = self.match.player_ids_dict
-        sorted_players = sorted(start_moment.players, key=lambda player: player.team.id)
-
         annotations = [
-            ax.annotate(f'{player_dict[player.id][1]}', xy=pos, color='white', ha='center', va='center', fontweight='bold')
-            for player, pos in zip(sorted_players[:5], home_positions)
-        ]
-        annotations += [
-            ax.annotate(f'{player_dict[player.id][1]}', xy=pos, color='white', ha='center', va='center', fontweight='bold')
-            for player, pos in zip(sorted_players[5:], away_positions)
+            ax.annotate(jersey, xy=position, color='white', ha='center', va='center', fontweight='bold')
+            for jersey, position in zip(self.jerseys[0], self.arrays.players[0])
         ]
 
-        column_labels = (sorted_players[0].team.name, sorted_players[5].team.name)
-        column_colours = (sorted_players[0].team.color, sorted_players[5].team.color)
+        player_dict = self.match.player_ids_dict
+        home_team, guest_team = Team(self.arrays.home_id), Team(self.arrays.visitor_id)
+        column_labels = (home_team.name, guest_team.name)
+        column_colours = (home_team.color, guest_team.color)
         cell_colours = [column_colours for _ in range(5)]
 
-        home_players = [' #'.join([player_dict[player.id][0], player_dict[player.id][1]]) for player in sorted_players[:5]]
-        guest_players = [' #'.join([player_dict[player.id][0], player_dict[player.id][1]]) for player in sorted_players[5:]]
-        players_data = list(zip(home_players, guest_players))
+        names = [' #'.join(player_dict.get(player_id, ('', ''))) for player_id in self.arrays.player_ids[0].tolist()]
+        players_data = list(zip(names[:PLAYERS_PER_TEAM], names[PLAYERS_PER_TEAM:]))
 
         table = plt.table(cellText=players_data, colLabels=column_labels, colColours=column_colours,
                           colWidths=[Settings.COLUMN_WIDTH, Settings.COLUMN_WIDTH], loc='bottom',
@@ -178,38 +156,35 @@ class TeamSpacingVisualizer:
         clock_info = ax.annotate('', xy=(50, 45), color='black', ha='center', va='center')
 
         anim = animation.FuncAnimation(
-            fig, self.update_visuals, frames=len(self.moments),
+            fig, self.update_visuals, frames=len(self.arrays),
             fargs=(home_circles, away_circles, ball_circle, hull_patch, annotations, clock_info),
             interval=100, blit=False, repeat=False
         )
 
         plt.show()
-        
-    def plot_team_defensive_spacing(self):
-        """Plot of team's defensive spacing (bar graph)"""
-        teams = ['DEN', 'DAL', 'TOR', 'MIL', 'CHA', 'POR', 'ATL', 'IND', 'BKN', 'SAC',
-                 'MIA', 'OKC', 'NYK', 'PHI', 'MEM', 'ORL', 'PHX', 'SAS', 'GSW', 'UTA',
-                 'MIN', 'BOS', 'LAL', 'CHI', 'HOU', 'NOP', 'CLE', 'LAC', 'WAS', 'DET']
-        
-        defensive_spacing = [62.2, 62.8, 62.9, 63, 63.3, 63.8, 63.8, 63.9, 63.9, 63.95,
-                             64.2, 64.29, 64.8, 65, 65.3, 65.3, 65.7, 65.8, 65.8, 65.83,
-                             65.85, 65.87, 65.89, 66.08, 66.12, 66.5, 66.6, 66.8, 67.68, 67.8]
-
-        team_colors = ['#4D90CD', '#007DC5', '#CE1141', '#00471B', '#1D1160', '#E03A3E', '#E13A3E',
-                       '#00275D', '#061922', '#724C9F', '#98002E', '#007DC3', '#006BB6', '#006BB6',
-                       '#0F586C', '#007DC5', '#1D1160', '#BAC3C9', '#FDB927', '#00471B', '#005083',
-                       '#008348', '#552582', '#CE1141', '#CE1141', '#002B5C', '#860038', '#ED174C',
-                       '#002B5C', '#006BB6']
-        
-        plt.figure(figsize=(12, 6))
-        plt.bar(teams, defensive_spacing, color=team_colors)
-        plt.xlabel('', fontsize=16)
-        plt.ylabel("Opponent's Defensive Spacing (sq ft)", fontsize=16)
-        plt.title("Team's Ability to Space the Defense", fontsize=18)
-        plt.xticks(rotation=45, ha='right')
-        plt.ylim(62, 68)
-        plt.tight_layout()
-        plt.show()
+
+
+def plot_team_defensive_spacing(defensive_spacing):
+    """Plot of team's defensive spacing (bar graph) from a season spacing table"""
+    defensive_spacing = defensive_spacing.dropna().sort_values()
+    if defensive_spacing.empty:
+        print("No defensive spacing to plot: the spacing table has no games with half-court moments")
+        return
+    team_colors_by_name = {name: color for color, name in Team.color_dict.values()}
+    teams = list(defensive_spacing.index)
+    team_colors = [team_colors_by_name[team] for team in teams]
+    y_limits = (defensive_spacing.min() - 1, defensive_spacing.max() + 1)
+
+    plt.figure(figsize=(12, 6))
+    plt.bar(teams, list(defensive_spacing), color=team_colors)
+    plt.xlabel('', fontsize=16)
+    plt.ylabel("Opponent's Defensive Spacing (sq ft)", fontsize=16)
+    plt.title("Team's Ability to Space the Defense", fontsize=18)
+    plt.xticks(rotation=45, ha='right')
+    plt.ylim(*y_limits)
+    plt.tight_layout()
+    plt.show()
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Visualize team spacing using Convex Hull with animation.')
@@ -221,5 +196,3 @@ if __name__ == "__main__":
     visualizer = TeamSpacingVisualizer(file_path=args.path, team_name=args.team)
     visualizer.load_data()
     visualizer.animate()
-
-    visualizer.plot_team_defensive_spacing()
@@ -0,0 +1,62 @@
+import io
+import json
+import pytest
+from event_stream import EventStream, iter_events
+
+GAME = {
+    'gameid': '0021500001',
+    'events': [
+        {'eventId': '1', 'moments': [[1, 1451606400000, 720.0, 24.0, None, [[-1, -1, 47.25, 25.5, 3.1]]]]},
+        {'eventId': '2', 'note': 'Nenê – Đorđević \U0001f3c0', 'moments': []},
+        {'eventId': '3', 'moments': [[1, 1451606400040, 719.96, 23.96, None, [[1610612737, 201939, -1e-3, 12345, 0]]]]},
+    ],
+    'gamedate': '2016-01-01',
+}
+
+
+def read(text, chunk_size, as_bytes=True):
+    """Parse a game through EventStream and return its events and header"""
+    stream = io.BytesIO(text.encode('utf-8')) if as_bytes else io.StringIO(text)
+    events_stream = EventStream(stream, chunk_size=chunk_size)
+    return list(events_stream), events_stream.header
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 1 << 16])
+@pytest.mark.parametrize('as_bytes', [True, False])
+def test_chunk_boundaries_inside_numbers_strings_and_characters(chunk_size, as_bytes):
+    events, header = read(json.dumps(GAME, ensure_ascii=False), chunk_size, as_bytes)
+
+    assert events == GAME['events']
+    assert header == {'gameid': '0021500001', 'gamedate': '2016-01-01'}
+
+
+def test_header_keys_are_collected_before_and_after_events():
+    text = '{"gameid": "1", "events": [{"eventId": 1}], "gamedate": "2016-01-01", "extra": [1, 2]}'
+    events, header = read(text, 4)
+
+    assert events == [{'eventId': 1}]
+    assert header == {'gameid': '1', 'gamedate': '2016-01-01', 'extra': [1, 2]}
+
+
+@pytest.mark.parametrize('text', ['{"gameid": "1", "events": []}', '{"events" : [ ] , "gameid":"1"}'])
+def test_empty_events_list(text):
+    events, header = read(text, 1)
+
+    assert events == []
+    assert header == {'gameid': '1'}
+
+
+def test_empty_game_object():
+    assert read('{ }', 1) == ([], {})
+
+
+def test_truncated_stream_is_reported():
+    with pytest.raises(ValueError):
+        read('{"gameid": "1", "events": [{"eventId": 1}', 4)
+
+
+def test_iter_events_reads_a_json_file(tmp_path):
+    path = tmp_path / 'game.json'
+    path.write_text(json.dumps(GAME), encoding='utf-8')
+
+    assert list(iter_events(str(path), chunk_size=5)) == GAME['events']
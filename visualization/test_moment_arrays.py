@@ -0,0 +1,94 @@
+import numpy as np
+from scipy.spatial import ConvexHull
+from moment_arrays import MomentArrays, team_hull_areas
+
+HOME_ID = 1610612737
+VISITOR_ID = 1610612738
+HOME_PLAYERS = [100, 101, 102, 103, 104]
+VISITOR_PLAYERS = [200, 201, 202, 203, 204]
+
+
+def make_moment(timestamp, home_players=HOME_PLAYERS, visitor_players=VISITOR_PLAYERS, ball=True, quarter=1):
+    """A raw SportVU moment where every player stands at a position derived from their id"""
+    entries = [[-1, -1, 47.0, 25.0, 5.0]] if ball else []
+    for team_id, players in ((HOME_ID, home_players), (VISITOR_ID, visitor_players)):
+        entries += [[team_id, player, float(player % 100) * 10 + 5, float(player // 100) * 10, 0.0]
+                    for player in players]
+    return [quarter, timestamp, 720.0 - timestamp / 1000, 24.0, None, entries]
+
+
+def slots_of(arrays, player):
+    """Set of slots a player was stored in over all moments"""
+    return set(np.nonzero(arrays.player_ids == player)[1].tolist())
+
+
+def test_missing_player_is_not_replaced_by_a_neighbour():
+    moments = [make_moment(0), make_moment(40, home_players=[100, 102, 103, 104])]
+    arrays = MomentArrays.from_moments(moments, HOME_ID, VISITOR_ID).repair()
+
+    assert arrays.player_ids[1, :5].tolist() == [100, 0, 102, 103, 104]
+    assert arrays.valid.tolist() == [True, False]
+    assert arrays.repaired['players'] == 0
+
+
+def test_players_keep_their_slot_when_listing_order_changes():
+    moments = [make_moment(0),
+               make_moment(40, home_players=[104, 102, 100, 103, 101]),
+               make_moment(80, visitor_players=[203, 204, 200, 201, 202])]
+    arrays = MomentArrays.from_moments(moments, HOME_ID, VISITOR_ID)
+
+    for player in HOME_PLAYERS + VISITOR_PLAYERS:
+        assert len(slots_of(arrays, player)) == 1
+    assert (arrays.players == arrays.players[0]).all()
+
+
+def test_gap_is_filled_only_when_the_same_player_returns():
+    moments = [make_moment(0),
+               make_moment(40, home_players=[100, 102, 103, 104]),
+               make_moment(80)]
+    arrays = MomentArrays.from_moments(moments, HOME_ID, VISITOR_ID).repair()
+
+    assert arrays.valid.all()
+    assert arrays.repaired['players'] == 1
+    assert arrays.player_ids[1, 1] == 101
+    assert (arrays.players[1] == arrays.players[0]).all()
+
+
+def test_substitute_takes_the_free_slot_without_a_fill():
+    moments = [make_moment(0),
+               make_moment(40, home_players=[100, 102, 103, 104]),
+               make_moment(80, home_players=[100, 105, 102, 103, 104])]
+    arrays = MomentArrays.from_moments(moments, HOME_ID, VISITOR_ID).repair()
+
+    assert arrays.player_ids[2, :5].tolist() == [100, 105, 102, 103, 104]
+    assert arrays.valid.tolist() == [True, False, True]
+
+
+def test_anomalies_are_counted_and_invalidate_moments():
+    moments = [make_moment(0, ball=False),
+               make_moment(40, home_players=HOME_PLAYERS + [105]),
+               make_moment(80, home_players=[100, 100, 101, 102, 103, 104]),
+               make_moment(80)]
+    arrays = MomentArrays.from_events([{'moments': moments, 'home': {'teamid': HOME_ID},
+                                        'visitor': {'teamid': VISITOR_ID}}])
+    report = arrays.report()
+
+    assert report['missing_ball'] == 1
+    assert report['extra_players'] == 1
+    assert report['duplicate_players'] == 1
+    assert report['repeated_moments'] == 1
+    assert arrays.valid.tolist() == [False, False, True]
+
+
+def test_team_hull_areas_match_scipy():
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(0, 50, size=(200, 5, 2))
+    expected = [ConvexHull(points).volume for points in positions]
+
+    assert np.allclose(team_hull_areas(positions), expected)
+
+
+def test_team_hull_area_of_collinear_players_is_zero():
+    positions = np.array([[[0, 0], [1, 1], [2, 2], [3, 3], [4, 4]]], dtype=float)
+
+    assert team_hull_areas(positions).tolist() == [0.0]
@@ -0,0 +1,79 @@
+import threading
+from MomentBuffer import MomentBuffer
+
+TIMEOUT = 5
+
+
+def run(target, *args):
+    """Start target on a daemon thread and collect its return value"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(target(*args)), daemon=True)
+    thread.start()
+    return thread, result
+
+
+def test_moments_come_out_in_order_across_the_ring():
+    buffer = MomentBuffer(3)
+    taken = []
+    for moment in range(10):
+        assert buffer.put(moment)
+        if len(buffer) == 3:
+            taken.append(buffer.get())
+    buffer.close()
+    while (moment := buffer.get()) is not None:
+        taken.append(moment)
+
+    assert taken == list(range(10))
+
+
+def test_put_blocks_while_the_buffer_is_full():
+    buffer = MomentBuffer(2)
+    buffer.put('a')
+    buffer.put('b')
+    thread, result = run(buffer.put, 'c')
+
+    thread.join(0.2)
+    assert thread.is_alive()
+    assert len(buffer) == 2
+
+    assert buffer.get() == 'a'
+    thread.join(TIMEOUT)
+    assert result == [True]
+    assert [buffer.get(), buffer.get()] == ['b', 'c']
+
+
+def test_close_releases_a_blocked_put():
+    buffer = MomentBuffer(1)
+    buffer.put('a')
+    thread, result = run(buffer.put, 'b')
+
+    thread.join(0.2)
+    assert thread.is_alive()
+    buffer.close()
+    thread.join(TIMEOUT)
+
+    assert result == [False]
+    assert buffer.get() == 'a'
+    assert buffer.get() is None
+
+
+def test_close_releases_a_blocked_get():
+    buffer = MomentBuffer(2)
+    thread, result = run(buffer.get)
+
+    thread.join(0.2)
+    assert thread.is_alive()
+    buffer.close()
+    thread.join(TIMEOUT)
+
+    assert result == [None]
+
+
+def test_get_drains_the_buffer_after_close():
+    buffer = MomentBuffer(4)
+    buffer.put('a')
+    buffer.put('b')
+    buffer.close()
+
+    assert not buffer.put('c')
+    assert [buffer.get(), buffer.get(), buffer.get()] == ['a', 'b', None]